@@ -58,29 +58,36 @@ def push_to_github(repo_url, git_path):
     print(f"\n📤 Pushing code to GitHub...")
     
     try:
-        # Verify remote is set correctly
+        # Verify remote is set correctly (output is ignored, so send it
+        # to DEVNULL - a filling pipe buffer can deadlock the child)
         subprocess.run(
             [git_path, "remote", "remove", "origin"],
             cwd="e:\\building-energy-api",
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=5
         )
-        
+
         # Add new remote
         subprocess.run(
             [git_path, "remote", "add", "origin", repo_url],
             cwd="e:\\building-energy-api",
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=5
         )
-        
-        # Push to GitHub
+
+        # Push to GitHub. Discard stdout (large pushes can emit more
+        # than a pipe buffer holds) but keep stderr for error messages;
+        # 300s bounds a truly hung network push
         result = subprocess.run(
             [git_path, "push", "-u", "origin", "main"],
             cwd="e:\\building-energy-api",
-            capture_output=True,
-            timeout=30,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=300,
+            text=True,
+            check=False
         )
         
         if result.returncode == 0:
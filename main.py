@@ -1,57 +1,93 @@
 """
 Building Energy Data API - Simple REST API for managing building energy
 """
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from collections import OrderedDict
 from datetime import datetime
-from models import BuildingCreate, Building, EnergyReadingCreate, EnergyReading, EnergyReadingsResponse
+from typing import Literal
+import asyncio
+import hashlib
+import msgspec
+from models import BuildingCreate, EnergyReadingCreate, EnergyReadingsResponse
 import storage
 
+# Pre-bound locals for the hot paths: LOAD_GLOBAL + LOAD_ATTR chains
+# become single-name lookups. (The old valid-types lists are gone -
+# that validation lives in the Pydantic Literal fields now.)
+_utcnow = datetime.utcnow
+_blake2b = hashlib.blake2b
+
+
+class MsgspecResponse(Response):
+    """JSON response encoded by msgspec's C encoder.
+
+    Handles msgspec Structs and datetimes natively, so response models
+    go straight from slotted structs to UTF-8 bytes.
+    """
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return msgspec.json.encode(content)
+
+
 # Create the FastAPI app
 app = FastAPI(
     title="Building Energy Data API",
-    description="Simple API for managing building energy data"
+    description="Simple API for managing building energy data",
+    default_response_class=MsgspecResponse
 )
 
+# Handlers run on the event loop now (no per-request threadpool hop).
+# The loop itself serializes them, but the lock keeps writes atomic in
+# case a write path ever gains an await point or a second worker
+_write_lock = asyncio.Lock()
+
+# LRU cache of encoded readings responses, keyed by (building, version,
+# filters). The version in the key means a new reading simply makes old
+# entries unreachable; eviction keeps the cache bounded. Cache hits
+# skip row materialization and JSON encoding entirely.
+_readings_cache = OrderedDict()
+_READINGS_CACHE_SIZE = 256
+
 # ============================================================
 # BUILDING ENDPOINTS
 # ============================================================
 
-@app.post("/buildings", response_model=Building, status_code=201)
-def create_building(building: BuildingCreate):
+@app.post("/buildings", status_code=201)
+async def create_building(building: BuildingCreate):
     """Create a new building
     
     Required fields:
     - name: Building name
     - address: Building address
     - type: "residential", "commercial", or "industrial"
+
+    Field validation (type, non-negative consumption) happens in the
+    Pydantic models, so invalid input gets a 422 before we get here.
     """
-    # Check if type is valid
-    valid_types = ["residential", "commercial", "industrial"]
-    if building.type not in valid_types:
-        raise HTTPException(status_code=400, detail=f"Type must be one of: {valid_types}")
-    
     # Create building
-    new_building = storage.create_building(building)
-    return new_building
+    async with _write_lock:
+        new_building = storage.create_building(building)
+    return MsgspecResponse(new_building, status_code=201)
 
 
-@app.get("/buildings/{building_id}", response_model=Building)
-def get_building(building_id: str):
+@app.get("/buildings/{building_id}")
+async def get_building(building_id: str):
     """Get a building by ID"""
     building = storage.get_building(building_id)
     
     if not building:
         raise HTTPException(status_code=404, detail=f"Building {building_id} not found")
-    
-    return building
+
+    return MsgspecResponse(building)
 
 
 # ============================================================
 # ENERGY READING ENDPOINTS
 # ============================================================
 
-@app.post("/buildings/{building_id}/readings", response_model=EnergyReading, status_code=201)
-def add_reading(building_id: str, reading: EnergyReadingCreate):
+@app.post("/buildings/{building_id}/readings", status_code=201)
+async def add_reading(building_id: str, reading: EnergyReadingCreate):
     """Add an energy reading to a building
     
     Required fields:
@@ -59,19 +95,11 @@ def add_reading(building_id: str, reading: EnergyReadingCreate):
     - consumption_kwh: Energy used in kilowatt-hours (must be >= 0)
     - source_type: "solar", "grid", or "battery"
     """
-    # Check if consumption is negative
-    if reading.consumption_kwh < 0:
-        raise HTTPException(status_code=400, detail="Consumption cannot be negative")
-    
-    # Check if source type is valid
-    valid_sources = ["solar", "grid", "battery"]
-    if reading.source_type not in valid_sources:
-        raise HTTPException(status_code=400, detail=f"Source must be: {valid_sources}")
-    
     try:
         # Add reading
-        new_reading = storage.add_reading(building_id, reading)
-        return new_reading
+        async with _write_lock:
+            new_reading = storage.add_reading(building_id, reading)
+        return MsgspecResponse(new_reading, status_code=201)
     except ValueError as e:
         # Handle errors like building not found or duplicate reading
         error_msg = str(e)
@@ -83,59 +111,89 @@ def add_reading(building_id: str, reading: EnergyReadingCreate):
             raise HTTPException(status_code=400, detail=error_msg)
 
 
-@app.get("/buildings/{building_id}/readings", response_model=EnergyReadingsResponse)
-def get_readings(
+@app.post("/buildings/{building_id}/readings:batch")
+async def add_readings_batch(building_id: str, readings: list[EnergyReadingCreate]):
+    """Add several energy readings in one request
+
+    Amortizes the HTTP round-trip and request parsing across items.
+    Each item reports its own success or failure, so one duplicate
+    doesn't fail the whole batch.
+    """
+    if not storage.get_building(building_id):
+        raise HTTPException(status_code=404, detail=f"Building {building_id} not found")
+
+    results = []
+    async with _write_lock:
+        for reading in readings:
+            try:
+                results.append({"ok": True, "reading": storage.add_reading(building_id, reading)})
+            except ValueError as e:
+                results.append({"ok": False, "error": str(e)})
+    return MsgspecResponse(results)
+
+
+@app.get("/buildings/{building_id}/readings")
+async def get_readings(
+    request: Request,
     building_id: str,
-    start_date: str = Query(None, description="Start date in ISO format"),
-    end_date: str = Query(None, description="End date in ISO format"),
-    source_type: str = Query(None, description="Filter by: solar, grid, or battery")
+    start_date: datetime | None = Query(None, description="Start date in ISO format"),
+    end_date: datetime | None = Query(None, description="End date in ISO format"),
+    source_type: Literal["solar", "grid", "battery"] | None = Query(None, description="Filter by source")
 ):
-    """Get energy readings for a building with optional filters"""
-    
-    # Parse dates if provided
-    start_datetime = None
-    end_datetime = None
-    
-    if start_date:
-        try:
-            start_datetime = datetime.fromisoformat(start_date)
-        except:
-            raise HTTPException(status_code=400, detail=f"Invalid start_date format: {start_date}")
-    
-    if end_date:
-        try:
-            end_datetime = datetime.fromisoformat(end_date)
-        except:
-            raise HTTPException(status_code=400, detail=f"Invalid end_date format: {end_date}")
-    
-    # Validate source type if provided
-    if source_type and source_type not in ["solar", "grid", "battery"]:
-        raise HTTPException(status_code=400, detail="Source must be: solar, grid, or battery")
-    
+    """Get energy readings for a building with optional filters
+
+    The dates and the source filter are parsed and validated by
+    FastAPI, so a malformed value gets a 422 before we get here.
+    """
+    # The ETag only changes when the building gets a new reading or the
+    # filters differ, so polling clients can skip the full response
+    version = storage.versions.get(building_id, 0)
+    etag = _blake2b(
+        f"{building_id}:{version}:{start_date}:{end_date}:{source_type}".encode(),
+        digest_size=8
+    ).hexdigest()
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    # Serve the preformed bytes if this exact query was answered before
+    cache_key = (building_id, version, start_date, end_date, source_type)
+    cached = _readings_cache.get(cache_key)
+    if cached is not None:
+        _readings_cache.move_to_end(cache_key)
+        return Response(content=cached, media_type="application/json",
+                        headers={"ETag": etag})
+
     try:
         # Get readings from storage
         all_readings = storage.get_readings(
             building_id,
-            start_date=start_datetime,
-            end_date=end_datetime,
+            start_date=start_date,
+            end_date=end_date,
             source_type=source_type
         )
-        
+
         # Track which filters were used
         filters_used = {}
         if start_date:
-            filters_used["start_date"] = start_date
+            filters_used["start_date"] = start_date.isoformat()
         if end_date:
-            filters_used["end_date"] = end_date
+            filters_used["end_date"] = end_date.isoformat()
         if source_type:
             filters_used["source_type"] = source_type
         
-        # Return response
-        return EnergyReadingsResponse(
+        # Encode once, cache the bytes, and return them
+        body = msgspec.json.encode(EnergyReadingsResponse(
             readings=all_readings,
             total_count=len(all_readings),
             filters_applied=filters_used
-        )
+        ))
+        _readings_cache[cache_key] = body
+        if len(_readings_cache) > _READINGS_CACHE_SIZE:
+            _readings_cache.popitem(last=False)
+
+        return Response(content=body, media_type="application/json",
+                        headers={"ETag": etag})
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -145,7 +203,7 @@ def get_readings(
 # ============================================================
 
 @app.get("/")
-def home():
+async def home():
     """Simple test endpoint"""
     return {
         "message": "Building Energy API is working!",
@@ -153,9 +211,9 @@ def home():
     }
 
 @app.get("/health")
-def health():
+async def health():
     """Health check endpoint"""
-    return {"status": "OK", "time": datetime.utcnow().isoformat()}
+    return {"status": "OK", "time": _utcnow().isoformat()}
 
 
 # ============================================================
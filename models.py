@@ -1,31 +1,43 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, NonNegativeFloat
 from datetime import datetime
+from typing import Literal
+import msgspec
+
+# Request models stay Pydantic so FastAPI validates incoming bodies.
+# Response models are msgspec Structs: slotted (no __dict__, ~3x less
+# memory per instance) and encoded by msgspec's C JSON encoder.
 
 # Simple model for creating a building request
 class BuildingCreate(BaseModel):
     name: str
     address: str
-    type: str  # "residential", "commercial", or "industrial"
+    type: Literal["residential", "commercial", "industrial"]
 
 # Model for building response (includes id and timestamp)
-class Building(BuildingCreate):
+class Building(msgspec.Struct):
     id: str
+    name: str
+    address: str
+    type: str
     created_at: datetime
 
 # Simple model for creating an energy reading
 class EnergyReadingCreate(BaseModel):
     timestamp: datetime
-    consumption_kwh: float  # This should be >= 0
-    source_type: str  # "solar", "grid", or "battery"
+    consumption_kwh: NonNegativeFloat
+    source_type: Literal["solar", "grid", "battery"]
 
 # Model for energy reading response
-class EnergyReading(EnergyReadingCreate):
+class EnergyReading(msgspec.Struct):
     id: str
     building_id: str
+    timestamp: datetime
+    consumption_kwh: float
+    source_type: str
     created_at: datetime
 
 # Response model for getting multiple readings
-class EnergyReadingsResponse(BaseModel):
-    readings: list
+class EnergyReadingsResponse(msgspec.Struct):
+    readings: list[EnergyReading]
     total_count: int
-    filters_applied: dict
+    filters_applied: dict[str, str]
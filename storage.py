@@ -1,92 +1,169 @@
-from datetime import datetime
-from uuid import uuid4
+from datetime import datetime, timedelta
+import itertools
+import secrets
+import sqlite3
+import struct
 from models import Building, EnergyReading, BuildingCreate, EnergyReadingCreate
 
-# Simple global storage - just dictionaries to store data in memory
+# Small int codes for source types - stored in the src column so the
+# index stays compact
+_SOURCE_CODE = {"solar": 0, "grid": 1, "battery": 2}
+_SOURCE_NAME = ["solar", "grid", "battery"]  # reverse lookup by code
+
+# IDs are a short random per-process prefix plus a monotonic counter:
+# collision-free within a process (unlike truncated uuid4 hex) and no
+# os.urandom syscall on the insert path
+_PROC = secrets.token_hex(2)  # once per process
+_building_counter = itertools.count(1)
+_reading_counter = itertools.count(1)
+
+# Pre-bound for the insert hot path (skips LOAD_GLOBAL + LOAD_ATTR)
+_utcnow = datetime.utcnow
+
+# In-memory SQLite database. The B-tree indexes below give O(log N + k)
+# range/source lookups in compiled C, replacing the hand-rolled Python
+# indexes; the UNIQUE index doubles as the duplicate-reading check.
+conn = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("""
+    CREATE TABLE readings (
+        id TEXT PRIMARY KEY,
+        building_id TEXT,
+        ts INTEGER,       -- microseconds since epoch
+        kwh REAL,
+        src INTEGER,
+        created INTEGER   -- microseconds since epoch
+    )
+""")
+conn.execute("CREATE INDEX ix_b_ts ON readings(building_id, ts)")
+conn.execute("CREATE INDEX ix_b_src ON readings(building_id, src)")
+conn.execute("CREATE UNIQUE INDEX ux_dedup ON readings(building_id, ts, src)")
+
+# One query string per filter combination, built once at import. Reads
+# pick theirs by (start?, end?, source?) key instead of concatenating
+# SQL per request, and sqlite3's statement cache reuses the same
+# prepared statement across calls.
+_QUERIES = {
+    (has_start, has_end, has_source):
+        "SELECT * FROM readings WHERE building_id = ?"
+        + (" AND ts >= ?" if has_start else "")
+        + (" AND ts <= ?" if has_end else "")
+        + (" AND src = ?" if has_source else "")
+        + " ORDER BY ts DESC"
+    for has_start in (False, True)
+    for has_end in (False, True)
+    for has_source in (False, True)
+}
+
+# Buildings are few and read whole, so they stay as plain objects
 buildings = {}  # stores buildings: {id: building_object}
-readings = {}   # stores readings: {building_id: [reading1, reading2, ...]}
-used_readings = set()  # keep track of readings we've already seen (to prevent duplicates)
+versions = {}  # bumped on every write: {building_id: int}, used for ETag caching
+
+
+def _to_us(timestamp):
+    """Convert a datetime to integer microseconds since the epoch"""
+    return int(timestamp.timestamp() * 1_000_000)
+
+
+def _from_us(us):
+    """Convert integer microseconds since the epoch back to a datetime"""
+    seconds, rem = divmod(int(us), 1_000_000)
+    return datetime.fromtimestamp(seconds) + timedelta(microseconds=rem)
+
+
+def _quantize_kwh(kwh):
+    """Round consumption to float32 precision (~7 significant digits),
+    ample for kWh meter readings"""
+    return struct.unpack("<f", struct.pack("<f", kwh))[0]
+
+
+def _row_to_reading(row):
+    """Materialize one database row as an EnergyReading model"""
+    reading_id, building_id, ts, kwh, src, created = row
+    return EnergyReading(
+        id=reading_id,
+        building_id=building_id,
+        timestamp=_from_us(ts),
+        consumption_kwh=kwh,
+        source_type=_SOURCE_NAME[src],
+        created_at=_from_us(created),
+    )
+
 
 def create_building(building_data):
     """Create a new building and save it"""
     # Generate a simple ID
-    building_id = f"b_{uuid4().hex[:6]}"
-    
+    building_id = f"b_{_PROC}{next(_building_counter):08x}"
+
     # Create building object with timestamp
     building = Building(
         id=building_id,
         name=building_data.name,
         address=building_data.address,
         type=building_data.type,
-        created_at=datetime.utcnow()
+        created_at=_utcnow()
     )
-    
+
     # Save it to our storage
     buildings[building_id] = building
-    readings[building_id] = []  # Create empty list for this building's readings
-    
+    versions[building_id] = 0
+
     return building
 
+
 def get_building(building_id):
     """Get a building by ID"""
     if building_id in buildings:
         return buildings[building_id]
     return None
 
+
 def add_reading(building_id, reading_data):
     """Add a reading for a building"""
     # Check if building exists
     if building_id not in buildings:
         raise ValueError(f"Building {building_id} not found")
-    
-    # Check for duplicate readings (same building, time, and source)
-    reading_key = (building_id, str(reading_data.timestamp), reading_data.source_type)
-    if reading_key in used_readings:
-        raise ValueError("This exact reading already exists!")
-    
+
     # Generate reading ID
-    reading_id = f"r_{uuid4().hex[:6]}"
-    
-    # Create reading object
-    reading = EnergyReading(
-        id=reading_id,
-        building_id=building_id,
-        timestamp=reading_data.timestamp,
-        consumption_kwh=reading_data.consumption_kwh,
-        source_type=reading_data.source_type,
-        created_at=datetime.utcnow()
+    reading_id = f"r_{_PROC}{next(_reading_counter):08x}"
+    created_at = _utcnow()
+
+    row = (
+        reading_id,
+        building_id,
+        _to_us(reading_data.timestamp),
+        _quantize_kwh(reading_data.consumption_kwh),
+        _SOURCE_CODE[reading_data.source_type],
+        _to_us(created_at),
     )
-    
-    # Save to storage
-    readings[building_id].append(reading)
-    used_readings.add(reading_key)
-    
-    return reading
+    try:
+        conn.execute("INSERT INTO readings VALUES (?, ?, ?, ?, ?, ?)", row)
+    except sqlite3.IntegrityError:
+        # The unique (building, ts, src) index caught a duplicate
+        raise ValueError("This exact reading already exists!")
+
+    versions[building_id] += 1
+
+    return _row_to_reading(row)
+
 
 def get_readings(building_id, start_date=None, end_date=None, source_type=None):
     """Get readings for a building with optional filters"""
     # Check if building exists
     if building_id not in buildings:
         raise ValueError(f"Building {building_id} not found")
-    
-    # Get all readings for this building
-    all_readings = readings.get(building_id, [])
-    
-    # Apply filters
-    filtered = all_readings
-    
-    # Filter by date range if provided
+
+    # Pick the precompiled query for the active filters; SQLite
+    # evaluates them against the (building_id, ts) / (building_id, src)
+    # indexes
+    params = [building_id]
     if start_date:
-        filtered = [r for r in filtered if r.timestamp >= start_date]
-    
+        params.append(_to_us(start_date))
     if end_date:
-        filtered = [r for r in filtered if r.timestamp <= end_date]
-    
-    # Filter by source type if provided
+        params.append(_to_us(end_date))
     if source_type:
-        filtered = [r for r in filtered if r.source_type == source_type]
-    
-    # Sort by newest first
-    filtered.sort(key=lambda r: r.timestamp, reverse=True)
-    
-    return filtered
+        params.append(_SOURCE_CODE[source_type])
+    sql = _QUERIES[(start_date is not None, end_date is not None,
+                    source_type is not None)]
+
+    return [_row_to_reading(row) for row in conn.execute(sql, params)]
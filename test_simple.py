@@ -78,7 +78,7 @@ def test_add_reading():
 
 
 def test_add_reading_negative_consumption():
-    """Test that negative consumption is rejected"""
+    """Test that negative consumption is rejected (422 from Pydantic)"""
     building_response = client.post("/buildings", json={
         "name": "Test",
         "address": "123 St",
@@ -92,7 +92,7 @@ def test_add_reading_negative_consumption():
         "source_type": "solar"
     })
     
-    assert response.status_code == 400
+    assert response.status_code == 422
 
 
 def test_get_readings():
@@ -122,6 +122,61 @@ def test_get_readings():
     assert len(data["readings"]) == 2
 
 
+def test_add_readings_batch():
+    """Test adding several readings in one batch call"""
+    # Create building
+    building_response = client.post("/buildings", json={
+        "name": "Test",
+        "address": "123 St",
+        "type": "industrial"
+    })
+    building_id = building_response.json()["id"]
+
+    # Post 3 readings at once, the last one a duplicate of the first
+    now = datetime.utcnow()
+    response = client.post(f"/buildings/{building_id}/readings:batch", json=[
+        {"timestamp": now.isoformat(), "consumption_kwh": 10.0, "source_type": "grid"},
+        {"timestamp": (now + timedelta(hours=1)).isoformat(), "consumption_kwh": 20.0, "source_type": "solar"},
+        {"timestamp": now.isoformat(), "consumption_kwh": 10.0, "source_type": "grid"},
+    ])
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["ok"] for r in results] == [True, True, False]
+
+    # Only the two unique readings were stored
+    response = client.get(f"/buildings/{building_id}/readings")
+    assert response.json()["total_count"] == 2
+
+
+def test_get_readings_etag():
+    """Test that an unchanged readings list returns 304 via ETag"""
+    # Create building with one reading
+    building_response = client.post("/buildings", json={
+        "name": "Test",
+        "address": "123 St",
+        "type": "commercial"
+    })
+    building_id = building_response.json()["id"]
+    client.post(f"/buildings/{building_id}/readings", json={
+        "timestamp": datetime.utcnow().isoformat(),
+        "consumption_kwh": 12.0,
+        "source_type": "solar"
+    })
+
+    # First request gives us an ETag
+    response = client.get(f"/buildings/{building_id}/readings")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    # Same request with If-None-Match is a 304
+    response = client.get(
+        f"/buildings/{building_id}/readings",
+        headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+
 if __name__ == "__main__":
     # Run a simple test
     print("Running basic tests...")